@@ -71,6 +71,7 @@ from .core.fields import (
     ListField,
     ObjectIdField,
     PolylinePointsField,
+    RawArrayField,
     StringField,
     TargetsField,
     VectorField,
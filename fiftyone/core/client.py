@@ -36,6 +36,19 @@ class HasClient(object):
     _HC_ATTR_NAME = None
     _HC_ATTR_TYPE = None
 
+    # Clients store a fixed set of attributes, so skip the per-instance
+    # `__dict__` in favor of faster C-level slot access
+    __slots__ = (
+        "_port",
+        "_address",
+        "_data",
+        "_client",
+        "_initial_connection",
+        "_url",
+        "_listeners",
+        "_thread",
+    )
+
     def __init__(self, port, address):
         self._port = port
         self._address = address or "localhost"
@@ -129,6 +142,11 @@ class HasClient(object):
 
     def __getattr__(self, name):
         """Gets the data via the attribute defined by ``_HC_ATTR_NAME``."""
+        if name[:1] == "_":
+            # Fast path for missing private attributes and the dunders that
+            # Python probes during pickling/introspection
+            raise AttributeError(name)
+
         if name == self._HC_ATTR_NAME:
             if self._client is None and not self._initial_connection:
                 raise RuntimeError("Session is not connected")
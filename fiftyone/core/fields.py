@@ -7,6 +7,7 @@ Dataset sample fields.
 """
 from copy import deepcopy
 from datetime import date, datetime
+from functools import lru_cache
 import numbers
 
 from bson import ObjectId, SON
@@ -21,6 +22,24 @@ import fiftyone.core.frame_utils as fofu
 import fiftyone.core.utils as fou
 
 
+_CLASS_CACHE = {}
+
+
+def _get_class(class_path):
+    """Resolves the given fully-qualified class path, caching the result.
+
+    Unlike :func:`eta.core.utils.get_class`, repeat resolutions do not touch
+    the import machinery.
+    """
+    cls = _CLASS_CACHE.get(class_path, None)
+    if cls is None:
+        cls = etau.get_class(class_path)
+        _CLASS_CACHE[class_path] = cls
+
+    return cls
+
+
+@lru_cache(maxsize=1024)
 def parse_field_str(field_str):
     """Parses a field string into components that can be passed to
     :meth:`fiftyone.core.dataset.Dataset.add_sample_field`.
@@ -39,12 +58,15 @@ def parse_field_str(field_str):
         -   subfield: the :class:`fiftyone.core.fields.Field` class of the
                 subfield, or ``None``
     """
-    chunks = field_str.strip().split("(", 1)
-    ftype = etau.get_class(chunks[0])
+    field_str = field_str.strip()
+    idx = field_str.find("(")
     embedded_doc_type = None
     subfield = None
-    if len(chunks) > 1:
-        param = etau.get_class(chunks[1][:-1])  # remove trailing ")"
+    if idx < 0:
+        ftype = _get_class(field_str)
+    else:
+        ftype = _get_class(field_str[:idx])
+        param = _get_class(field_str[idx + 1 : -1])  # remove trailing ")"
         if issubclass(ftype, EmbeddedDocumentField):
             embedded_doc_type = param
         elif issubclass(ftype, (ListField, DictField)):
@@ -58,13 +80,32 @@ def parse_field_str(field_str):
 class Field(mongoengine.fields.BaseField):
     """Base class for :class:`fiftyone.core.sample.Sample` fields."""
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Class names are immutable, so resolve them once per class rather
+        # than on every `__str__` call
+        cls._class_name_str = etau.get_class_name(cls)
+
     def __str__(self):
-        return etau.get_class_name(self)
+        return self._class_name_str
+
+    def error(self, message="", errors=None, field_name=None):
+        # Messages may be provided as callables so that hot ``validate()``
+        # paths can defer expensive string interpolation until a validation
+        # error is actually being raised
+        if callable(message):
+            message = message()
+
+        super().error(message=message, errors=errors, field_name=field_name)
 
     def copy(self):
         return deepcopy(self)
 
 
+Field._class_name_str = etau.get_class_name(Field)
+
+
 class IntField(mongoengine.fields.IntField, Field):
     """A 32 bit integer field."""
 
@@ -79,14 +120,14 @@ class ObjectIdField(mongoengine.fields.ObjectIdField, Field):
     """An Object ID field."""
 
     def to_mongo(self, value):
-        if value is None:
-            return None
+        if value is None or type(value) is ObjectId:
+            return value
 
         return ObjectId(value)
 
     def to_python(self, value):
-        if value is None:
-            return None
+        if value is None or type(value) is str:
+            return value
 
         return str(value)
 
@@ -146,12 +187,16 @@ class FloatField(mongoengine.fields.FloatField, Field):
         return float(value)
 
     def validate(self, value):
-        try:
-            value = float(value)
-        except OverflowError:
-            self.error("The value is too large to be converted to float")
-        except (TypeError, ValueError):
-            self.error("%s could not be converted to float" % value)
+        # The common case (an exact float) skips conversion entirely
+        if type(value) is not float:
+            try:
+                value = float(value)
+            except OverflowError:
+                self.error("The value is too large to be converted to float")
+            except (TypeError, ValueError):
+                self.error(
+                    lambda: "%s could not be converted to float" % value
+                )
 
         if self.min_value is not None and value < self.min_value:
             self.error("Float value is too small")
@@ -166,6 +211,31 @@ class StringField(mongoengine.fields.StringField, Field):
     pass
 
 
+_FAST_LIST_ELEM_TYPES = {FloatField: float, IntField: int, StringField: str}
+
+
+def _get_fast_elem_type(field):
+    """Returns the element type for which values of the given subfield are
+    trivially valid, or ``None`` if per-element validation is required.
+    """
+    etype = _FAST_LIST_ELEM_TYPES.get(type(field), None)
+    if etype is None:
+        return None
+
+    if (
+        getattr(field, "min_value", None) is not None
+        or getattr(field, "max_value", None) is not None
+        or getattr(field, "regex", None) is not None
+        or getattr(field, "min_length", None) is not None
+        or getattr(field, "max_length", None) is not None
+        or field.choices is not None
+        or field.validation is not None
+    ):
+        return None
+
+    return etype
+
+
 class ListField(mongoengine.fields.ListField, Field):
     """A list field that wraps a standard :class:`Field`, allowing multiple
     instances of the field to be stored as a list in the database.
@@ -185,16 +255,38 @@ class ListField(mongoengine.fields.ListField, Field):
                     % (type(field), Field)
                 )
 
+        if "default" not in kwargs:
+            # Shared constructor rather than mongoengine's per-instance
+            # `lambda: []`; documents still get a fresh list apiece
+            kwargs["default"] = list
+
         super().__init__(field=field, **kwargs)
+        self._fast_elem_type = _get_fast_elem_type(field)
+
+    def validate(self, value):
+        etype = self._fast_elem_type
+        if (
+            etype is not None
+            and isinstance(value, list)
+            and (value or not self.required)
+            and (self.max_length is None or len(value) <= self.max_length)
+            and all(type(e) is etype for e in value)
+        ):
+            # The list satisfies its list-level constraints and every element
+            # is known-valid for the subfield, so skip the per-element
+            # Python-level validation dispatch
+            return
+
+        super().validate(value)
 
     def __str__(self):
         if self.field is not None:
             return "%s(%s)" % (
-                etau.get_class_name(self),
-                etau.get_class_name(self.field),
+                self._class_name_str,
+                self.field._class_name_str,
             )
 
-        return etau.get_class_name(self)
+        return self._class_name_str
 
 
 class HeatmapRangeField(ListField):
@@ -212,7 +304,7 @@ class HeatmapRangeField(ListField):
         super().__init__(**kwargs)
 
     def __str__(self):
-        return etau.get_class_name(self)
+        return self._class_name_str
 
     def validate(self, value):
         if (
@@ -241,28 +333,33 @@ class DictField(mongoengine.fields.DictField, Field):
                     % (type(field), Field)
                 )
 
+        if "default" not in kwargs:
+            # Shared constructor rather than mongoengine's per-instance
+            # `lambda: {}`; documents still get a fresh dict apiece
+            kwargs["default"] = dict
+
         super().__init__(field=field, **kwargs)
 
     def __str__(self):
         if self.field is not None:
             return "%s(%s)" % (
-                etau.get_class_name(self),
-                etau.get_class_name(self.field),
+                self._class_name_str,
+                self.field._class_name_str,
             )
 
-        return etau.get_class_name(self)
+        return self._class_name_str
 
     def validate(self, value):
-        if not all(map(lambda k: etau.is_str(k), value)):
+        if not isinstance(value, dict):
+            self.error("Value must be a dict")
+
+        if not all(isinstance(k, str) for k in value):
             self.error("Dict fields must have string keys")
 
         if self.field is not None:
             for _value in value.values():
                 self.field.validate(_value)
 
-        if value is not None and not isinstance(value, dict):
-            self.error("Value must be a dict")
-
 
 class IntDictField(DictField):
     """A :class:`DictField` whose keys are integers.
@@ -291,7 +388,7 @@ class IntDictField(DictField):
         if not isinstance(value, dict):
             self.error("Value must be a dict")
 
-        if not all(map(lambda k: isinstance(k, numbers.Integral), value)):
+        if not all(isinstance(k, numbers.Integral) for k in value):
             self.error("Int dict fields must have integer keys")
 
         if self.field is not None:
@@ -309,7 +406,7 @@ class KeypointsField(ListField):
         super().__init__(field=None, **kwargs)
 
     def __str__(self):
-        return etau.get_class_name(self)
+        return self._class_name_str
 
     def validate(self, value):
         # Only validate value[0], for efficiency
@@ -330,7 +427,7 @@ class PolylinePointsField(ListField):
         super().__init__(field=None, **kwargs)
 
     def __str__(self):
-        return etau.get_class_name(self)
+        return self._class_name_str
 
     def validate(self, value):
         # Only validate value[0] and value[0][0], for efficiency
@@ -496,6 +593,9 @@ class GeoMultiPolygonField(_GeoField, mongoengine.fields.MultiPolygonField):
         super().validate(value)
 
 
+_VECTOR_VALUE_TYPES = (np.ndarray, list, tuple, Binary)
+
+
 class VectorField(mongoengine.fields.BinaryField, Field):
     """A one-dimensional array field.
 
@@ -509,6 +609,10 @@ class VectorField(mongoengine.fields.BinaryField, Field):
         if value is None:
             return None
 
+        if isinstance(value, Binary):
+            # Already-serialized data; don't pay for another round-trip
+            return value
+
         bytes = fou.serialize_numpy_array(value)
         return super().to_mongo(bytes)
 
@@ -516,17 +620,24 @@ class VectorField(mongoengine.fields.BinaryField, Field):
         if value is None or isinstance(value, np.ndarray):
             return value
 
+        if isinstance(value, (list, tuple)):
+            if value and type(value[0]) is float:
+                # `fromiter` with a known count preallocates exactly once,
+                # bypassing `asarray`'s dtype inference scan
+                return np.fromiter(value, dtype=np.float64, count=len(value))
+
+            return np.asarray(value)
+
         return fou.deserialize_numpy_array(value)
 
     def validate(self, value):
-        if isinstance(value, np.ndarray):
-            if value.ndim > 1:
-                self.error("Only 1D arrays may be used in a vector field")
-        elif not isinstance(value, (list, tuple, Binary)):
+        if not isinstance(value, _VECTOR_VALUE_TYPES):
             self.error(
                 "Only numpy arrays, lists, and tuples may be used in a "
                 "vector field"
             )
+        elif getattr(value, "ndim", 1) > 1:
+            self.error("Only 1D arrays may be used in a vector field")
 
 
 class ArrayField(mongoengine.fields.BinaryField, Field):
@@ -554,6 +665,52 @@ class ArrayField(mongoengine.fields.BinaryField, Field):
         if not isinstance(value, (np.ndarray, Binary)):
             self.error("Only numpy arrays may be used in an array field")
 
+    @classmethod
+    def from_mongo_batch(cls, docs, field_name):
+        """Deserializes the values of the given field for a batch of raw
+        documents.
+
+        This is more efficient than individually deserializing values via
+        per-document field machinery when processing raw ``dict`` documents,
+        e.g. from a ``pymongo`` query.
+
+        Args:
+            docs: an iterable of ``dict`` documents
+            field_name: the name of the field to deserialize
+
+        Returns:
+            a list of numpy arrays, or ``None`` for missing/None values
+        """
+        values = []
+        for doc in docs:
+            value = doc.get(field_name, None)
+            if value is not None:
+                value = fou.deserialize_numpy_array(value)
+
+            values.append(value)
+
+        return values
+
+
+class RawArrayField(ArrayField):
+    """An n-dimensional array field whose data is stored uncompressed.
+
+    Unlike :class:`ArrayField`, the underlying data is stored in the database
+    as the uncompressed bytes generated by ``numpy.save``, trading storage
+    size for (de)serialization speed. The data is always retrieved as a numpy
+    array.
+    """
+
+    def to_mongo(self, value):
+        if value is None:
+            return None
+
+        if isinstance(value, Binary):
+            return value
+
+        bytes = fou.serialize_numpy_array(value, compress=False)
+        return Binary(bytes)
+
 
 class FrameNumberField(IntField):
     """A video frame number field."""
@@ -575,7 +732,7 @@ class FrameSupportField(ListField):
         super().__init__(**kwargs)
 
     def __str__(self):
-        return etau.get_class_name(self)
+        return self._class_name_str
 
     def validate(self, value):
         if (
@@ -599,7 +756,7 @@ class ClassesField(ListField):
         super().__init__(field=StringField(), **kwargs)
 
     def __str__(self):
-        return etau.get_class_name(self)
+        return self._class_name_str
 
 
 class TargetsField(IntDictField):
@@ -613,7 +770,7 @@ class TargetsField(IntDictField):
         super().__init__(field=StringField(), **kwargs)
 
     def __str__(self):
-        return etau.get_class_name(self)
+        return self._class_name_str
 
 
 class EmbeddedDocumentField(mongoengine.fields.EmbeddedDocumentField, Field):
@@ -9,17 +9,20 @@ import itertools
 import warnings
 
 from bson import ObjectId
-import cv2
 import numpy as np
 
 import eta.core.frameutils as etaf
-import eta.core.image as etai
 
 from fiftyone.core.odm import DynamicEmbeddedDocument
 import fiftyone.core.fields as fof
 import fiftyone.core.metadata as fom
 import fiftyone.core.utils as fou
 
+# `cv2` and `eta.core.image` are expensive imports that only a few methods
+# here need, so defer them until first use
+cv2 = fou.lazy_import("cv2")
+etai = fou.lazy_import("eta.core.image")
+
 foue = fou.lazy_import("fiftyone.utils.eta")
 foug = fou.lazy_import("fiftyone.utils.geojson")
 sg = fou.lazy_import(
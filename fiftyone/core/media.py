@@ -5,7 +5,9 @@ Sample media utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-import eta.core.video as etav
+import fiftyone.core.utils as fou
+
+etav = fou.lazy_import("eta.core.video")
 
 
 # Valid media types
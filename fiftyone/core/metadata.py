@@ -14,13 +14,14 @@ import requests
 from PIL import Image
 
 import eta.core.utils as etau
-import eta.core.video as etav
 
 from fiftyone.core.odm import DynamicEmbeddedDocument
 import fiftyone.core.fields as fof
 import fiftyone.core.media as fom
 import fiftyone.core.utils as fou
 
+etav = fou.lazy_import("eta.core.video")
+
 
 logger = logging.getLogger(__name__)
 
@@ -11,12 +11,10 @@ import logging
 
 import numpy as np
 
-import eta.core.image as etai
 import eta.core.frameutils as etaf
 import eta.core.learning as etal
 import eta.core.models as etam
 import eta.core.utils as etau
-import eta.core.video as etav
 import eta.core.web as etaw
 
 import fiftyone as fo
@@ -25,6 +23,9 @@ import fiftyone.core.media as fom
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
+etai = fou.lazy_import("eta.core.image")
+etav = fou.lazy_import("eta.core.video")
+
 tud = fou.lazy_import("torch.utils.data")
 
 foue = fou.lazy_import("fiftyone.utils.eta")
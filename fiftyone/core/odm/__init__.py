@@ -15,6 +15,7 @@ from .database import (
     get_db_conn,
     get_async_db_client,
     get_async_db_conn,
+    disconnect_db,
     drop_database,
     sync_database,
     list_datasets,
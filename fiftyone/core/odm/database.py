@@ -14,7 +14,7 @@ import os
 import asyncio
 from bson import json_util
 from bson.codec_options import CodecOptions
-from mongoengine import connect
+from mongoengine import connect, disconnect
 import mongoengine.errors as moe
 import motor.motor_asyncio as mtr
 
@@ -43,6 +43,10 @@ _async_client = None
 _connection_kwargs = {}
 _db_service = None
 
+# Cached `Database` handles keyed by (kind, database name, timezone), so that
+# repeated `get_db_conn()` calls don't rebuild handles and codec options
+_database_cache = {}
+
 
 #
 # IMPORTANT DATABASE CONFIG REQUIREMENTS
@@ -171,6 +175,7 @@ def establish_db_conn(config):
     _client = pymongo.MongoClient(
         **_connection_kwargs, appname=foc.DATABASE_APPNAME
     )
+    _database_cache.clear()
     _validate_db_version(config, _client)
 
     # Register cleanup method
@@ -337,8 +342,14 @@ def get_db_conn():
         a ``pymongo.database.Database``
     """
     _connect()
-    db = _client[fo.config.database_name]
-    return _apply_options(db)
+
+    key = ("sync", fo.config.database_name, fo.config.timezone)
+    db = _database_cache.get(key)
+    if db is None:
+        db = _apply_options(_client[fo.config.database_name])
+        _database_cache[key] = db
+
+    return db
 
 
 def get_async_db_client():
@@ -357,8 +368,38 @@ def get_async_db_conn():
     Returns:
         a ``motor.motor_asyncio.AsyncIOMotorDatabase``
     """
-    db = get_async_db_client()[fo.config.database_name]
-    return _apply_options(db)
+    key = ("async", fo.config.database_name, fo.config.timezone)
+    db = _database_cache.get(key)
+    if db is None:
+        db = _apply_options(get_async_db_client()[fo.config.database_name])
+        _database_cache[key] = db
+
+    return db
+
+
+def disconnect_db():
+    """Disconnects from the database, closing the clients' connection pools
+    and releasing all cached database handles.
+
+    Clients are intended to be shared for the lifetime of the process, since
+    pymongo's connection pool lives on the client and recreating clients
+    forfeits its benefits; call this only when you are truly done with the
+    database. A new connection is transparently established by the next
+    database operation.
+    """
+    global _client
+    global _async_client
+
+    _database_cache.clear()
+
+    if _client is not None:
+        _client.close()
+        _client = None
+        disconnect()
+
+    if _async_client is not None:
+        _async_client.close()
+        _async_client = None
 
 
 def _apply_options(db):
@@ -31,6 +31,12 @@ from fiftyone.core.session.events import (
 
 logger = logging.getLogger(__name__)
 
+_EVENT_STREAM_HEADERS = {
+    "Accept": "text/event-stream",
+    "Content-type": "application/json",
+}
+_JSON_HEADERS = {"Content-type": "application/json"}
+
 
 @retry(wait_fixed=500, stop_max_delay=10000)
 def _ping(url: str) -> None:
@@ -65,10 +71,7 @@ class Client:
                 response = requests.post(
                     f"{self.origin}/events",
                     stream=True,
-                    headers={
-                        "Accept": "text/event-stream",
-                        "Content-type": "application/json",
-                    },
+                    headers=_EVENT_STREAM_HEADERS,
                     json=asdict(
                         ListenPayload(
                             events=[
@@ -156,7 +159,7 @@ class Client:
     def _post_event(self, event: Event) -> None:
         response = requests.post(
             f"{self.origin}/event",
-            headers={"Content-type": "application/json"},
+            headers=_JSON_HEADERS,
             json={
                 "event": event.get_event_name(),
                 "data": stringify(asdict(event, dict_factory=dict_factory)),
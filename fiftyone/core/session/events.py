@@ -28,6 +28,8 @@ EventType = t.Union[
 
 _camel_to_snake = re.compile(r"(?<!^)(?=[A-Z])")
 
+_event_registry: t.Dict[str, t.Type["Event"]] = {}
+
 
 @dataclass
 class Event:
@@ -35,7 +37,13 @@ class Event:
 
     @classmethod
     def get_event_name(cls) -> str:
-        return _camel_to_snake.sub("_", cls.__name__).lower()
+        # Cached per class, since every dispatched event recomputes this
+        name = cls.__dict__.get("_event_name", None)
+        if name is None:
+            name = _camel_to_snake.sub("_", cls.__name__).lower()
+            cls._event_name = name
+
+        return name
 
     @staticmethod
     def from_data(event_name: str, data: t.Union[str, dict]) -> EventType:
@@ -45,10 +53,13 @@ class Event:
         if isinstance(data, str):
             data = foj.FiftyOneJSONEncoder.loads(data)
 
-        event_cls = etau.get_class(
-            "".join(word.title() for word in event_name.split("_")),
-            "fiftyone.core.session.events",
-        )
+        event_cls = _event_registry.get(event_name, None)
+        if event_cls is None:
+            event_cls = etau.get_class(
+                "".join(word.title() for word in event_name.split("_")),
+                "fiftyone.core.session.events",
+            )
+            _event_registry[event_name] = event_cls
 
         if event_cls == StateUpdate:
             data["state"] = fos.StateDescription.from_dict(data["state"])
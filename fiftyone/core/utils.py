@@ -835,6 +835,9 @@ class ProgressBar(etau.ProgressBar):
         super().__init__(*args, **kwargs)
 
 
+_SampleCollection = None
+
+
 class DynamicBatcher(object):
     """Class for iterating over the elements of an iterable with a dynamic
     batch size to achieve a desired latency.
@@ -901,9 +904,16 @@ class DynamicBatcher(object):
         progress=False,
         total=None,
     ):
-        import fiftyone.core.collections as foc
+        global _SampleCollection
+        if _SampleCollection is None:
+            # Imported here at runtime to avoid a circular import, but only
+            # once, so that constructing batchers in a loop doesn't hit the
+            # import machinery every time
+            from fiftyone.core.collections import SampleCollection
+
+            _SampleCollection = SampleCollection
 
-        if not isinstance(iterable, foc.SampleCollection):
+        if not isinstance(iterable, _SampleCollection):
             return_views = False
 
         self.iterable = iterable
@@ -1252,20 +1262,25 @@ def compute_filehash(filepath, method=None, chunk_size=None):
     return hasher.hexdigest()
 
 
-def serialize_numpy_array(array, ascii=False):
+def serialize_numpy_array(array, ascii=False, compress=True):
     """Serializes a numpy array.
 
     Args:
         array: a numpy array-like
         ascii (False): whether to return a base64-encoded ASCII string instead
             of raw bytes
+        compress (True): whether to zlib-compress the serialized bytes.
+            Skipping compression trades storage size for speed
 
     Returns:
         the serialized bytes
     """
     with io.BytesIO() as f:
         np.save(f, np.asarray(array), allow_pickle=False)
-        bytes_str = zlib.compress(f.getvalue())
+        bytes_str = f.getvalue()
+
+    if compress:
+        bytes_str = zlib.compress(bytes_str)
 
     if ascii:
         bytes_str = b64encode(bytes_str).decode("ascii")
@@ -1288,7 +1303,11 @@ def deserialize_numpy_array(numpy_bytes, ascii=False):
     if ascii:
         numpy_bytes = b64decode(numpy_bytes.encode("ascii"))
 
-    with io.BytesIO(zlib.decompress(numpy_bytes)) as f:
+    # Uncompressed bytes start with the `numpy.save` magic string
+    if numpy_bytes[:6] != b"\x93NUMPY":
+        numpy_bytes = zlib.decompress(numpy_bytes)
+
+    with io.BytesIO(numpy_bytes) as f:
         return np.load(f)
 
 
@@ -12,15 +12,16 @@ import os
 import pathlib
 import urllib
 
-import eta.core.image as etai
 import eta.core.serial as etas
 import eta.core.utils as etau
-import eta.core.video as etav
 
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
 import fiftyone.core.utils as fou
 
+etai = fou.lazy_import("eta.core.image")
+etav = fou.lazy_import("eta.core.video")
+
 
 logger = logging.getLogger(__name__)
 
@@ -14,8 +14,6 @@ import warnings
 from bson import json_util
 import numpy as np
 
-import eta.core.datasets as etad
-import eta.core.image as etai
 import eta.core.frameutils as etaf
 import eta.core.serial as etas
 import eta.core.utils as etau
@@ -32,6 +30,9 @@ import fiftyone.core.utils as fou
 import fiftyone.utils.eta as foue
 import fiftyone.utils.patches as foup
 
+etad = fou.lazy_import("eta.core.datasets")
+etai = fou.lazy_import("eta.core.image")
+
 from .parsers import (
     FiftyOneLabeledImageSampleParser,
     FiftyOneUnlabeledImageSampleParser,
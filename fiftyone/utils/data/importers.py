@@ -12,13 +12,9 @@ import os
 import random
 
 from bson import json_util
-import cv2
 
-import eta.core.datasets as etad
-import eta.core.image as etai
 import eta.core.serial as etas
 import eta.core.utils as etau
-import eta.core.video as etav
 
 import fiftyone.core.annotation as foa
 import fiftyone.core.brain as fob
@@ -36,6 +32,11 @@ import fiftyone.core.utils as fou
 import fiftyone.migrations as fomi
 import fiftyone.types as fot
 
+cv2 = fou.lazy_import("cv2")
+etad = fou.lazy_import("eta.core.datasets")
+etai = fou.lazy_import("eta.core.image")
+etav = fou.lazy_import("eta.core.video")
+
 from .parsers import (
     FiftyOneImageClassificationSampleParser,
     FiftyOneTemporalDetectionSampleParser,
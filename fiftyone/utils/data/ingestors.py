@@ -7,7 +7,6 @@ Dataset ingestors.
 """
 import logging
 
-import eta.core.image as etai
 import eta.core.utils as etau
 
 import fiftyone as fo
@@ -20,6 +19,8 @@ from .importers import (
     LabeledVideoDatasetImporter,
 )
 
+etai = fou.lazy_import("eta.core.image")
+
 
 logger = logging.getLogger(__name__)
 
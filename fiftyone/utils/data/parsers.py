@@ -9,7 +9,6 @@ import os
 
 import numpy as np
 
-import eta.core.image as etai
 import eta.core.serial as etas
 import eta.core.utils as etau
 
@@ -22,6 +21,7 @@ import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 import fiftyone.utils.eta as foue
 
+etai = fou.lazy_import("eta.core.image")
 fouv = fou.lazy_import("fiftyone.utils.video")
 
 
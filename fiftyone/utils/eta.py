@@ -16,16 +16,18 @@ import eta.core.events as etae
 import eta.core.frames as etaf
 import eta.core.frameutils as etafu
 import eta.core.geometry as etag
-import eta.core.image as etai
 import eta.core.keypoints as etak
 import eta.core.learning as etal
 import eta.core.objects as etao
 import eta.core.polylines as etap
 import eta.core.utils as etau
-import eta.core.video as etav
 
 import fiftyone.core.labels as fol
 import fiftyone.core.models as fom
+import fiftyone.core.utils as fou
+
+etai = fou.lazy_import("eta.core.image")
+etav = fou.lazy_import("eta.core.video")
 
 
 _IMAGE_MODELS = (
@@ -11,15 +11,16 @@ import warnings
 import numpy as np
 import sklearn.metrics as skm
 
-import eta.core.image as etai
-
 import fiftyone.core.evaluation as foe
 import fiftyone.core.fields as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
 from .base import BaseEvaluationResults
 
+etai = fou.lazy_import("eta.core.image")
+
 
 logger = logging.getLogger(__name__)
 
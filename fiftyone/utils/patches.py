@@ -5,15 +5,15 @@ Image patch utilities.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
-import cv2
-
-import eta.core.image as etai
-
 import fiftyone.core.frame as fof
 import fiftyone.core.labels as fol
+import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 import fiftyone.utils.eta as foue
 
+cv2 = fou.lazy_import("cv2")
+etai = fou.lazy_import("eta.core.image")
+
 
 class ImagePatchesExtractor(object):
     """Class for iterating over the labeled/unlabeled image patches in a
@@ -5,8 +5,10 @@ FiftyOne utilities unit tests.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import io
 import time
 import unittest
+import zlib
 
 from mongoengine.errors import ValidationError
 import numpy as np
@@ -15,6 +17,7 @@ import fiftyone as fo
 import fiftyone.constants as foc
 import fiftyone.core.media as fom
 import fiftyone.core.uid as fou
+import fiftyone.core.utils as focu
 from fiftyone.migrations.runner import MigrationRunner
 
 from decorators import drop_datasets
@@ -154,6 +157,66 @@ class SerializationTests(unittest.TestCase):
         self.assertDictEqual(s1.to_dict(), s2.to_dict())
 
 
+class NumpySerializationTests(unittest.TestCase):
+    def test_compressed_round_trip(self):
+        array = np.random.rand(3, 4)
+
+        array_bytes = focu.serialize_numpy_array(array)
+        np.testing.assert_array_equal(
+            focu.deserialize_numpy_array(array_bytes), array
+        )
+
+    def test_uncompressed_round_trip(self):
+        array = np.random.rand(3, 4)
+
+        array_bytes = focu.serialize_numpy_array(array, compress=False)
+        self.assertEqual(array_bytes[:6], b"\x93NUMPY")
+        np.testing.assert_array_equal(
+            focu.deserialize_numpy_array(array_bytes), array
+        )
+
+    def test_ascii_round_trip(self):
+        array = np.random.rand(3, 4)
+
+        for compress in (True, False):
+            array_str = focu.serialize_numpy_array(
+                array, ascii=True, compress=compress
+            )
+            self.assertIsInstance(array_str, str)
+            np.testing.assert_array_equal(
+                focu.deserialize_numpy_array(array_str, ascii=True), array
+            )
+
+    def test_legacy_compressed_bytes(self):
+        # Blobs written before uncompressed storage existed are raw
+        # zlib-compressed `numpy.save` bytes; they must still deserialize
+        array = np.random.rand(3, 4)
+
+        with io.BytesIO() as f:
+            np.save(f, array, allow_pickle=False)
+            legacy_bytes = zlib.compress(f.getvalue())
+
+        np.testing.assert_array_equal(
+            focu.deserialize_numpy_array(legacy_bytes), array
+        )
+
+    def test_array_fields(self):
+        array = np.random.rand(3, 4)
+
+        field = fo.ArrayField()
+        value = field.to_mongo(array)
+        np.testing.assert_array_equal(field.to_python(value), array)
+
+        raw_field = fo.RawArrayField()
+        raw_value = raw_field.to_mongo(array)
+        self.assertEqual(bytes(raw_value)[:6], b"\x93NUMPY")
+        np.testing.assert_array_equal(raw_field.to_python(raw_value), array)
+
+        # Either field can read data written by the other
+        np.testing.assert_array_equal(field.to_python(raw_value), array)
+        np.testing.assert_array_equal(raw_field.to_python(value), array)
+
+
 class MediaTypeTests(unittest.TestCase):
     @drop_datasets
     def setUp(self):